@@ -49,15 +49,11 @@ _LOGGER = logging.getLogger(__name__)
 
 ADD_NEW_EVENT = "add_new_event"
 
-FILTER_OPTIONS = [CONF_ENTITY_ID, CONF_UNIT_OF_MEASUREMENT, CONF_ABOVE, CONF_BELOW]
+_MISSING = object()
 
 
-def _filter_str(index, filter):
-    entity_id = filter[CONF_ENTITY_ID]
-    unit = filter[CONF_UNIT_OF_MEASUREMENT]
-    above = filter[CONF_ABOVE]
-    below = filter[CONF_BELOW]
-    return f"{index+1}. {entity_id}, unit: {unit}, above: {above}, below: {below}"
+def _filter_str(number, entity_id, unit, above, below):
+    return f"{number}. {entity_id}, unit: {unit}, above: {above}, below: {below}"
 
 
 async def validate_input(hass: core.HomeAssistant, conf):
@@ -185,9 +181,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry):
         """Initialize localtuya options flow."""
         self.config_entry = config_entry
-        self.filters = None
+        self._filter_entity_ids = None
+        self._filter_units = None
+        self._filter_aboves = None
+        self._filter_belows = None
+        self._filter_strings = None
         self.events = None
         self.options = None
+        self._cached_de = None
+        self._cached_de_key = None
         self.remote = self.hass.data[DOMAIN][self.config_entry.entry_id][
             CONF_REMOTE_CONNECTION
         ]
@@ -232,6 +234,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         """Manage domain and entity filters."""
         if user_input is not None:
             self.options.update(user_input)
+            self._cached_de = self._cached_de_key = None
             return await self.async_step_general_filters()
 
         domains, entities = self._domains_and_entities()
@@ -264,30 +267,42 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             # Continue to next step if entity id is not specified
             if CONF_ENTITY_ID not in user_input:
-                # Each filter string is prefixed with a number (index in self.filter+1).
+                # Each filter string is prefixed with a number (filter index + 1).
                 # Extract all of them and build the final filter list.
-                selected_indices = [
-                    int(filter.split(".")[0]) - 1
+                self.options[CONF_FILTER] = [
+                    self._filter(int(filter.partition(".")[0]) - 1)
                     for filter in user_input.get(CONF_FILTER, [])
                 ]
-                self.options[CONF_FILTER] = [self.filters[i] for i in selected_indices]
                 return await self.async_step_events()
 
-            selected = user_input.get(CONF_FILTER, [])
-            new_filter = {conf: user_input.get(conf) for conf in FILTER_OPTIONS}
-            selected.append(_filter_str(len(self.filters), new_filter))
-            self.filters.append(new_filter)
+            new_str = self._add_filter(
+                user_input.get(CONF_ENTITY_ID),
+                user_input.get(CONF_UNIT_OF_MEASUREMENT),
+                user_input.get(CONF_ABOVE),
+                user_input.get(CONF_BELOW),
+            )
+            selected = [*user_input.get(CONF_FILTER, []), new_str]
         else:
-            self.filters = self.config_entry.options.get(CONF_FILTER, [])
-            selected = [_filter_str(i, filter) for i, filter in enumerate(self.filters)]
+            self._filter_entity_ids = []
+            self._filter_units = []
+            self._filter_aboves = []
+            self._filter_belows = []
+            self._filter_strings = []
+            for filter in self.config_entry.options.get(CONF_FILTER, []):
+                self._add_filter(
+                    filter.get(CONF_ENTITY_ID),
+                    filter.get(CONF_UNIT_OF_MEASUREMENT),
+                    filter.get(CONF_ABOVE),
+                    filter.get(CONF_BELOW),
+                )
+            selected = list(self._filter_strings)
 
-        strings = [_filter_str(i, filter) for i, filter in enumerate(self.filters)]
         return self.async_show_form(
             step_id="general_filters",
             data_schema=vol.Schema(
                 {
                     vol.Optional(CONF_FILTER, default=selected): cv.multi_select(
-                        strings
+                        self._filter_strings
                     ),
                     vol.Optional(CONF_ENTITY_ID): str,
                     vol.Optional(CONF_UNIT_OF_MEASUREMENT): str,
@@ -306,9 +321,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 )
                 return self.async_create_entry(title="", data=self.options)
 
-            selected = user_input.get(CONF_SUBSCRIBE_EVENTS, [])
-            self.events.add(user_input[ADD_NEW_EVENT])
-            selected.append(user_input[ADD_NEW_EVENT])
+            new_event = user_input[ADD_NEW_EVENT]
+            self.events.add(new_event)
+            selected = [*user_input.get(CONF_SUBSCRIBE_EVENTS, []), new_event]
         else:
             self.events = set(
                 self.config_entry.options.get(CONF_SUBSCRIBE_EVENTS) or []
@@ -327,9 +342,31 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             ),
         )
 
+    def _add_filter(self, entity_id, unit, above, below):
+        """Append a filter to the per-field lists and return its filter string."""
+        self._filter_entity_ids.append(entity_id)
+        self._filter_units.append(unit)
+        self._filter_aboves.append(above)
+        self._filter_belows.append(below)
+        filter_str = _filter_str(
+            len(self._filter_entity_ids), entity_id, unit, above, below
+        )
+        self._filter_strings.append(filter_str)
+        return filter_str
+
+    def _filter(self, index):
+        """Return filter at index as stored in options."""
+        return {
+            CONF_ENTITY_ID: self._filter_entity_ids[index],
+            CONF_UNIT_OF_MEASUREMENT: self._filter_units[index],
+            CONF_ABOVE: self._filter_aboves[index],
+            CONF_BELOW: self._filter_belows[index],
+        }
+
     def _default(self, conf):
         """Return default value for an option."""
-        return self.config_entry.options.get(conf) or vol.UNDEFINED
+        value = self.config_entry.options.get(conf, _MISSING)
+        return vol.UNDEFINED if value is _MISSING else value
 
     def _domains_and_entities(self):
         """Return all entities and domains exposed by remote instance."""
@@ -340,10 +377,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         # Include entities we have in the config explicitly, otherwise they will be
         # pre-selected and not possible to remove if they are no lobger present on
         # the remote host.
-        include_entities = set(self.config_entry.options.get(CONF_INCLUDE_ENTITIES, []))
-        exclude_entities = set(self.config_entry.options.get(CONF_EXCLUDE_ENTITIES, []))
+        include_entities = frozenset(
+            self.config_entry.options.get(CONF_INCLUDE_ENTITIES, [])
+        )
+        exclude_entities = frozenset(
+            self.config_entry.options.get(CONF_EXCLUDE_ENTITIES, [])
+        )
+
+        # The entity set is updated in place as the remote changes and the options
+        # may be replaced by a YAML reload, so compare against snapshots of all of
+        # them rather than the set identity.
+        key = (frozenset(remote._all_entity_names), include_entities, exclude_entities)
+        if self._cached_de is not None and key == self._cached_de_key:
+            return self._cached_de
+
         entities = sorted(
             remote._all_entity_names | include_entities | exclude_entities
         )
-        domains = sorted(set([entity_id.split(".")[0] for entity_id in entities]))
-        return domains, entities
+        domains = sorted({entity_id.split(".", 1)[0] for entity_id in entities})
+        self._cached_de = (domains, entities)
+        self._cached_de_key = key
+        return self._cached_de